@@ -1,8 +1,14 @@
 from telemetry.simulator import VehicleSimulator
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, Response, WebSocket
 from prometheus_fastapi_instrumentator import Instrumentator
-import random
+from collections import deque
 import asyncio
+import os
+import time
+
+# websocket batching: flush after WS_BATCH samples or WS_FLUSH_MS, whichever comes first
+WS_BATCH = max(1, int(os.getenv("TELEMETRY_WS_BATCH", "1")))
+WS_FLUSH_MS = max(0, int(os.getenv("TELEMETRY_WS_FLUSH_MS", "1000")))
 
 app = FastAPI(title="Vehicle Telemetry API")
 
@@ -16,19 +22,32 @@ def healthz():
 
 @app.get("/telemetry/latest")
 def latest():
-    return simulator.get_state()
+    return Response(content=simulator._latest_bytes, media_type="application/json")
 
 @app.websocket("/ws/telemetry")
 async def telemetry_stream(websocket: WebSocket):
     await websocket.accept()
+    buf = deque()
+    last_flush = time.monotonic()
     try:
         while True:
-            telemetry = simulator.get_state()
-            await websocket.send_json(telemetry)
-            await asyncio.sleep(1)
+            buf.append(await simulator.next_frame())
+            elapsed_ms = (time.monotonic() - last_flush) * 1000.0
+            if len(buf) >= WS_BATCH or elapsed_ms >= WS_FLUSH_MS:
+                # frames are already JSON; splice them into one array
+                await websocket.send_bytes(b"[" + b",".join(buf) + b"]")
+                buf.clear()
+                last_flush = time.monotonic()
     except Exception as e:
         print(f"WebSocket baglantisi kapandi: {e}")
 
 @app.on_event("startup")
 async def start_simulation():
     asyncio.create_task(simulator.run())
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # same settings as the documented uvicorn command; "auto" picks uvloop when installed, asyncio otherwise
+    # frames are tiny; skip zlib
+    uvicorn.run(app, loop="auto", http="httptools", ws_per_message_deflate=False)
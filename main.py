@@ -6,19 +6,13 @@ import math
 import os
 import queue
 import threading
-from typing import Deque, Dict, Optional, Tuple
+from typing import Deque, Dict, NamedTuple, Optional, Tuple
 from collections import deque
 from datetime import datetime
-from dataclasses import dataclass, field
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-
 
 TelemetryLogger = None
 Sensors = None
@@ -40,10 +34,21 @@ LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_PATH = os.path.join(LOG_DIR, "telemetry_log.csv")
 LOG_INTERVAL_S = 2.0  # keep parity with README
+LOG_BUFFER_BYTES = 64 * 1024
+PLOT_MARGIN = (56, 16, 16, 32)  # left, top, right, bottom (px) around the plot area
+SPEED_COLOR = "#1f77b4"
+RPM_COLOR = "#ff7f0e"
+LOG_FLUSH_INTERVAL_S = 5.0  # rows are queued at most this long before being written
+LOG_QUEUE_MAX_ROWS = 1024  # rows beyond this are dropped if the writer falls behind
+
+_fromtimestamp = datetime.fromtimestamp
+
+def _format_ts(ts: int) -> str:
+    return _fromtimestamp(ts).isoformat(timespec="seconds")
 
 # domain model
-@dataclass
-class VehicleState:
+# immutable snapshot: the model builds a new one every tick, so readers on other threads never see torn fields
+class VehicleState(NamedTuple):
     t: float = 0.0           # seconds since start
     speed_kph: float = 0.0
     rpm: float = 800.0
@@ -72,98 +77,114 @@ class VehicleModel:
         self.shift_up_rpm = 3000.0
         self.shift_down_rpm = 1100.0
 
+        # Per-tick constants: gear ratios indexed by gear (slot 0 unused)
+        self._gear_ratios_tbl = tuple([0.0] + [self.gear_ratios[g] for g in sorted(self.gear_ratios)])
+        self._top_gear = max(self.gear_ratios)
+        # engine rpm per m/s of road speed before the gear ratio: 60 * final_drive / wheel circumference
+        self._wheel_rps_k = 60.0 * self.final_drive / (2 * math.pi * self.wheel_radius_m)
+
         # Optional sensors instance
         self.sensors = Sensors() if Sensors else None
 
     def update(self, dt: float) -> None:
         s = self.state
-        if not s.engine_on:
-            s.throttle = 0.0
+        engine_on = s.engine_on
+        throttle = s.throttle if engine_on else 0.0
 
         # Convert speed to m/s for physics
         v_ms = s.speed_kph / 3.6
 
         # Forces
-        a_throttle = s.throttle * self.max_accel
+        a_throttle = throttle * self.max_accel
         a_brake = s.brake * self.max_brake
         a_drag = self.drag_coeff * v_ms
         a_net = a_throttle - a_brake - a_drag
 
         # Integrate speed
         v_ms = max(0.0, v_ms + a_net * dt)
-        s.speed_kph = v_ms * 3.6
 
         # Engine RPM via wheel speed & gearing; idle when nearly stopped
-        gear_ratio = self.gear_ratios.get(s.gear, 1.0)
+        gear = s.gear
+        idle = self.idle_rpm if engine_on else 0.0
         if v_ms < 0.1:
-            s.rpm = self.idle_rpm if s.engine_on else 0.0
+            rpm = idle
         else:
-            wheel_rps = v_ms / (2 * math.pi * self.wheel_radius_m)
-            engine_rpm = wheel_rps * 60 * self.final_drive * gear_ratio
-            s.rpm = max(self.idle_rpm if s.engine_on else 0.0, min(engine_rpm, self.redline_rpm))
+            engine_rpm = v_ms * self._wheel_rps_k * self._gear_ratios_tbl[gear]
+            rpm = max(idle, min(engine_rpm, self.redline_rpm))
 
         # Auto shift (toy)
-        if s.engine_on and s.rpm > self.shift_up_rpm and s.gear < max(self.gear_ratios):
-            s.gear += 1
-        elif s.engine_on and s.rpm < self.shift_down_rpm and s.gear > 1:
-            s.gear -= 1
+        if engine_on and rpm > self.shift_up_rpm and gear < self._top_gear:
+            gear += 1
+        elif engine_on and rpm < self.shift_down_rpm and gear > 1:
+            gear -= 1
 
         # Sensor updates (coolant/fuel/battery)
-        if self.sensors:
+        sensors = self.sensors
+        if sensors:
             try:
-                s.coolant_temp_c = self.sensors.get_coolant_temp(s.coolant_temp_c, s.engine_on, dt)
-                s.fuel_level_pct = self.sensors.get_fuel_level(s.fuel_level_pct, s.throttle, dt)
-                s.battery_v = self.sensors.get_battery_voltage(s.battery_v, s.engine_on, dt)
+                coolant = sensors.get_coolant_temp(s.coolant_temp_c, engine_on, dt)
+                fuel = sensors.get_fuel_level(s.fuel_level_pct, throttle, dt)
+                battery = sensors.get_battery_voltage(s.battery_v, engine_on, dt)
             except Exception:
-                self._fallback_sensors(dt)
+                coolant, fuel, battery = self._fallback_sensors(s, throttle, dt)
         else:
-            self._fallback_sensors(dt)
-
-        s.t += dt
-
-    def _fallback_sensors(self, dt: float) -> None:
-        s = self.state
+            coolant, fuel, battery = self._fallback_sensors(s, throttle, dt)
+
+        self.state = VehicleState(
+            t=s.t + dt,
+            speed_kph=v_ms * 3.6,
+            rpm=rpm,
+            throttle=throttle,
+            brake=s.brake,
+            gear=gear,
+            engine_on=engine_on,
+            coolant_temp_c=coolant,
+            fuel_level_pct=fuel,
+            battery_v=battery,
+        )
+
+    def _fallback_sensors(self, s: VehicleState, throttle: float, dt: float) -> Tuple[float, float, float]:
         # Warm to ~92°C when on, cool toward 20°C when off
         target = 92.0 if s.engine_on else 20.0
-        s.coolant_temp_c += (target - s.coolant_temp_c) * min(1.0, dt * 0.02)
+        coolant = s.coolant_temp_c + (target - s.coolant_temp_c) * min(1.0, dt * 0.02)
         # Crude fuel burn
-        s.fuel_level_pct = max(0.0, s.fuel_level_pct - (0.00002 + 0.0004 * s.throttle) * dt)
+        fuel = max(0.0, s.fuel_level_pct - (0.00002 + 0.0004 * throttle) * dt)
         # Battery hover around 12–14 V
         drift = (0.05 if s.engine_on else -0.02) * dt
-        s.battery_v = max(11.5, min(14.2, s.battery_v + drift))
+        battery = max(11.5, min(14.2, s.battery_v + drift))
+        return coolant, fuel, battery
 
 class Simulator(threading.Thread):
-    def __init__(self, model: VehicleModel, state_out: queue.Queue, cmd_in: queue.Queue, hz: int = 60):
+    def __init__(self, model: VehicleModel, cmd_in: queue.Queue, hz: int = 60):
         super().__init__(daemon=True)
         self.model = model
-        self.state_out = state_out
         self.cmd_in = cmd_in
+        # single-slot latest-value register read by the UI; a plain attribute store is atomic
+        self.latest_state: VehicleState = model.state
         self.hz = hz
-        self.dt = 1.0 / hz
+        self.dt_ns = 1_000_000_000 // hz  # tick length; integer ns so the accumulator never drifts
+        self.dt = self.dt_ns * 1e-9
         self._running = threading.Event()
         self._running.set()
+        self._wake = threading.Event()  # set on new commands / stop() to end the tick wait early
 
     def run(self) -> None:
-        last = time.perf_counter()
-        accum = 0.0
+        dt, dt_ns = self.dt, self.dt_ns
+        last = time.monotonic_ns()
+        accum = 0
         while self._running.is_set():
             self._drain_commands()
-            now = time.perf_counter()
+            now = time.monotonic_ns()
             accum += now - last
             last = now
-            while accum >= self.dt:
-                self.model.update(self.dt)
-                accum -= self.dt
-                # publish latest state (drop if queue full)
-                try:
-                    self.state_out.put_nowait(self.model.state)
-                except queue.Full:
-                    try:
-                        _ = self.state_out.get_nowait()
-                        self.state_out.put_nowait(self.model.state)
-                    except queue.Empty:
-                        pass
-            time.sleep(0.001)
+            while accum >= dt_ns:
+                self.model.update(dt)
+                accum -= dt_ns
+                # publish latest state
+                self.latest_state = self.model.state
+            # sleep until the next tick boundary unless a command arrives first
+            self._wake.wait(timeout=(dt_ns - accum) * 1e-9)
+            self._wake.clear()
 
     def _drain_commands(self) -> None:
         try:
@@ -171,20 +192,70 @@ class Simulator(threading.Thread):
                 cmd, payload = self.cmd_in.get_nowait()
                 s = self.model.state
                 if cmd == "throttle":
-                    s.throttle = float(payload)
+                    self.model.state = s._replace(throttle=float(payload))
                 elif cmd == "brake":
-                    s.brake = float(payload)
+                    self.model.state = s._replace(brake=float(payload))
                 elif cmd == "engine_on":
-                    s.engine_on = bool(payload)
+                    self.model.state = s._replace(engine_on=bool(payload))
                 elif cmd == "gear":
-                    s.gear = max(1, min(6, int(payload)))
+                    self.model.state = s._replace(gear=max(1, min(6, int(payload))))
                 elif cmd == "reset":
                     self.model.state = VehicleState()
         except queue.Empty:
             pass
 
+    def notify(self) -> None:
+        self._wake.set()
+
     def stop(self):
         self._running.clear()
+        self._wake.set()
+
+class LogWriter(threading.Thread):
+    """Appends CSV rows off the UI thread, one writerows() per flush interval.
+
+    Rows carry an epoch-seconds int in column 0, formatted here rather than on the UI thread.
+    On a write error the thread stops and leaves the exception in ``error`` for the UI to report.
+    """
+
+    def __init__(self, fp, flush_interval_s: float = LOG_FLUSH_INTERVAL_S):
+        super().__init__(daemon=True)
+        self.fp = fp
+        self.writer = csv.writer(fp)
+        self.flush_interval_s = flush_interval_s
+        self.rows: queue.Queue[list] = queue.Queue(maxsize=LOG_QUEUE_MAX_ROWS)
+        self.error: Optional[Exception] = None
+        self._stopping = threading.Event()
+
+    def put(self, row: list) -> None:
+        try:
+            self.rows.put_nowait(row)
+        except queue.Full:
+            pass  # writer is behind or dead; drop rather than grow without bound
+
+    def run(self) -> None:
+        stopping = False
+        while not stopping:
+            stopping = self._stopping.wait(timeout=self.flush_interval_s)
+            batch = []
+            try:
+                while True:
+                    row = self.rows.get_nowait()
+                    row[0] = _format_ts(row[0])
+                    batch.append(row)
+            except queue.Empty:
+                pass
+            if not batch:
+                continue
+            try:
+                self.writer.writerows(batch)
+                self.fp.flush()
+            except Exception as e:
+                self.error = e
+                return
+
+    def stop(self) -> None:
+        self._stopping.set()
 
 class App(tk.Tk):
     def __init__(self) -> None:
@@ -193,22 +264,22 @@ class App(tk.Tk):
         self.geometry("1060x720")
         self.minsize(960, 640)
 
-# queues for thread comms
-        self.state_q: queue.Queue[VehicleState] = queue.Queue(maxsize=5)
+# queue for thread comms (state comes back via self.sim.latest_state)
         self.cmd_q: queue.Queue[Tuple[str, object]] = queue.Queue()
 
 # core
         self.model = VehicleModel()
-        self.sim = Simulator(self.model, self.state_q, self.cmd_q)
+        self.sim = Simulator(self.model, self.cmd_q)
         self.sim.start()
 
 # logging
-        self._csv_writer = None
+        self._log_writer: Optional[LogWriter] = None
         self._csv_fp = None
         self._last_log_t = 0.0
         self._telemetry_logger = TelemetryLogger(LOG_PATH) if TelemetryLogger else None
 
 # build UI
+        self._last_ui: Dict[object, str] = {}  # last text pushed to each label / canvas text item
         self._build_controls()
         self._build_gauges()
         self._build_plot()
@@ -221,6 +292,7 @@ class App(tk.Tk):
         self.rpm_buf: Deque[float] = deque(maxlen=self.buf_len)
 
 # UI update loop
+        self._last_state: Optional[VehicleState] = None
         self.sample_interval_ms = 100  # 10 Hz UI refresh
         self.after(self.sample_interval_ms, self._on_timer)
 
@@ -282,19 +354,44 @@ class App(tk.Tk):
         frm = ttk.Frame(self)
         frm.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=12, pady=8)
 
-        fig = Figure(figsize=(8, 4), dpi=100)
-        self.ax = fig.add_subplot(111)
-        self.ax.set_xlabel("Time (s)")
-        self.ax.set_ylabel("Speed (km/h) / RPM (x100)")
-        self.ax.grid(True, alpha=0.3)
-
-        (self.speed_line,) = self.ax.plot([], [], label="Speed (km/h)")
-        (self.rpm_line,) = self.ax.plot([], [], label="RPM/100")
-        self.ax.legend(loc="upper right")
-
-        self.canvas = FigureCanvasTkAgg(fig, master=frm)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # plain Tk canvas: lines are created once and moved with coords() each frame
+        self.canvas = tk.Canvas(frm, width=800, height=400, background="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.plot_frame = self.canvas.create_rectangle(0, 0, 0, 0, outline="#bbbbbb")
+        self.speed_line = self.canvas.create_line(-10, -10, -10, -10, fill=SPEED_COLOR, width=2)
+        self.rpm_line = self.canvas.create_line(-10, -10, -10, -10, fill=RPM_COLOR, width=2)
+
+        # axis labels: y range on the left, time range along the bottom
+        self.ymax_lbl = self.canvas.create_text(0, 0, anchor=tk.NE, text="")
+        self.ymin_lbl = self.canvas.create_text(0, 0, anchor=tk.SE, text="")
+        self.t0_lbl = self.canvas.create_text(0, 0, anchor=tk.NW, text="")
+        self.t1_lbl = self.canvas.create_text(0, 0, anchor=tk.NE, text="")
+        self.x_axis_lbl = self.canvas.create_text(0, 0, anchor=tk.N, text="Time (s)")
+        self.legend_speed = self.canvas.create_text(0, 0, anchor=tk.NE, text="Speed (km/h)", fill=SPEED_COLOR)
+        self.legend_rpm = self.canvas.create_text(0, 0, anchor=tk.NE, text="RPM/100", fill=RPM_COLOR)
+
+        self._plot_size = (0, 0)
+        self.canvas.bind("<Configure>", self._on_plot_resize)
+
+    def _plot_area(self) -> Tuple[float, float, float, float]:
+        w, h = self._plot_size
+        left, top, right, bottom = PLOT_MARGIN
+        return left, top, max(left + 1, w - right), max(top + 1, h - bottom)
+
+    def _on_plot_resize(self, event: tk.Event) -> None:
+        self._plot_size = (event.width, event.height)
+        x0, y0, x1, y1 = self._plot_area()
+        c = self.canvas
+        c.coords(self.plot_frame, x0, y0, x1, y1)
+        c.coords(self.ymax_lbl, x0 - 6, y0)
+        c.coords(self.ymin_lbl, x0 - 6, y1)
+        c.coords(self.t0_lbl, x0, y1 + 4)
+        c.coords(self.t1_lbl, x1, y1 + 4)
+        c.coords(self.x_axis_lbl, (x0 + x1) / 2, y1 + 4)
+        c.coords(self.legend_speed, x1 - 8, y0 + 6)
+        c.coords(self.legend_rpm, x1 - 8, y0 + 22)
+        self._redraw()
 
     def _bind_keys(self) -> None:
         self.bind("<KeyPress-Up>", lambda e: self._set_throttle(1.0))
@@ -307,7 +404,8 @@ class App(tk.Tk):
         try:
             self.cmd_q.put_nowait((cmd, payload))
         except queue.Full:
-            pass
+            return
+        self.sim.notify()
 
     def _set_throttle(self, val: float) -> None:
         self._send_cmd("throttle", max(0.0, min(1.0, val)))
@@ -333,24 +431,25 @@ class App(tk.Tk):
 
 
     def _ensure_csv(self) -> None:
-        if self._csv_writer or self._telemetry_logger:
+        if self._log_writer or self._telemetry_logger:
             return
         try:
             fresh = not os.path.exists(LOG_PATH)
-            self._csv_fp = open(LOG_PATH, "a", newline="", encoding="utf-8")
-            self._csv_writer = csv.writer(self._csv_fp)
+            self._csv_fp = open(LOG_PATH, "a", newline="", encoding="utf-8", buffering=LOG_BUFFER_BYTES)
             if fresh:
-                self._csv_writer.writerow(["timestamp","rpm","speed_kph","coolant_c","fuel_pct","battery_v"])  # parity w/ README wording
+                csv.writer(self._csv_fp).writerow(["timestamp","rpm","speed_kph","coolant_c","fuel_pct","battery_v"])  # parity w/ README wording
+            self._log_writer = LogWriter(self._csv_fp)
+            self._log_writer.start()
         except Exception as e:
             messagebox.showerror("Logging error", str(e))
-            self._csv_writer = None
+            self._log_writer = None
 
     def _log_if_due(self, s: VehicleState) -> None:
         if (s.t - self._last_log_t) < LOG_INTERVAL_S:
             return
         self._last_log_t = s.t
         payload = {
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "timestamp": int(time.time()),
             "rpm": int(s.rpm),
             "speed_kph": round(s.speed_kph, 2),
             "coolant_c": round(s.coolant_temp_c, 1),
@@ -359,31 +458,45 @@ class App(tk.Tk):
         }
         if self._telemetry_logger:
             try:
-                self._telemetry_logger.log(payload)
+                self._telemetry_logger.log({**payload, "timestamp": _format_ts(payload["timestamp"])})
                 return
             except Exception:
                 pass  # fallback to CSV
+        if self._log_writer and self._log_writer.error:
+            err = self._log_writer.error
+            self._close_csv()
+            messagebox.showerror("Logging error", str(err))
         self._ensure_csv()
-        if self._csv_writer:
-            self._csv_writer.writerow(list(payload.values()))
-            if self._csv_fp:
-                self._csv_fp.flush()
+        if self._log_writer:
+            self._log_writer.put(list(payload.values()))
 
-    def _on_timer(self) -> None:
-        latest: Optional[VehicleState] = None
-        try:
-            while True:
-                latest = self.state_q.get_nowait()
-        except queue.Empty:
-            pass
+    def _close_csv(self) -> None:
+        writer, fp = self._log_writer, self._csv_fp
+        self._log_writer = None
+        self._csv_fp = None
+        if writer:
+            writer.stop()
+            writer.join(timeout=2.0)
+            if writer.is_alive():
+                return  # still writing; closing fp under it would fail mid-write
+        if fp:
+            try:
+                fp.close()
+            except Exception:
+                pass
 
-        if latest:
-            self.speed_lbl.configure(text=f"Speed: {latest.speed_kph:.1f} km/h")
-            self.rpm_lbl.configure(text=f"RPM: {latest.rpm:.0f}")
-            self.gear_lbl.configure(text=f"Gear: {latest.gear}")
-            self.temp_lbl.configure(text=f"Coolant: {latest.coolant_temp_c:.1f} °C")
-            self.fuel_lbl.configure(text=f"Fuel: {latest.fuel_level_pct:.1f} %")
-            self.batt_lbl.configure(text=f"Battery: {latest.battery_v:.2f} V")
+    def _on_timer(self) -> None:
+        latest: Optional[VehicleState] = self.sim.latest_state
+
+        # only consume a snapshot once; the simulator may not have ticked since the last frame
+        if latest is not None and latest is not self._last_state:
+            self._last_state = latest
+            self._set_label(self.speed_lbl, f"Speed: {latest.speed_kph:.1f} km/h")
+            self._set_label(self.rpm_lbl, f"RPM: {latest.rpm:.0f}")
+            self._set_label(self.gear_lbl, f"Gear: {latest.gear}")
+            self._set_label(self.temp_lbl, f"Coolant: {latest.coolant_temp_c:.1f} °C")
+            self._set_label(self.fuel_lbl, f"Fuel: {latest.fuel_level_pct:.1f} %")
+            self._set_label(self.batt_lbl, f"Battery: {latest.battery_v:.2f} V")
 
             # append to buffers
             self.t_buf.append(latest.t)
@@ -397,26 +510,57 @@ class App(tk.Tk):
 
         self.after(self.sample_interval_ms, self._on_timer)
 
+    def _set_label(self, lbl: ttk.Label, text: str) -> None:
+        # skip the Tcl round-trip when the rendered text hasn't changed
+        if self._last_ui.get(lbl) != text:
+            self._last_ui[lbl] = text
+            lbl.configure(text=text)
+
+    def _set_plot_text(self, item: int, text: str) -> None:
+        if self._last_ui.get(item) != text:
+            self._last_ui[item] = text
+            self.canvas.itemconfigure(item, text=text)
+
     def _redraw(self) -> None:
-        self.speed_line.set_data(self.t_buf, self.speed_buf)
-        self.rpm_line.set_data(self.t_buf, self.rpm_buf)
-        if self.t_buf:
-            t0, t1 = self.t_buf[0], self.t_buf[-1]
-            self.ax.set_xlim(t0, max(t1, t0 + 1.0))
-            all_y = list(self.speed_buf) + list(self.rpm_buf)
-            if all_y:
-                ymin, ymax = min(all_y), max(all_y)
-                pad = max(5.0, (ymax - ymin) * 0.1)
-                self.ax.set_ylim(max(0.0, ymin - pad), ymax + pad)
-        self.canvas.draw_idle()
+        c = self.canvas
+        n = len(self.t_buf)
+        if n == 0 or self._plot_size[0] == 0:
+            c.coords(self.speed_line, -10, -10, -10, -10)
+            c.coords(self.rpm_line, -10, -10, -10, -10)
+            return
+
+        t0, t1 = self.t_buf[0], self.t_buf[-1]
+        t1 = max(t1, t0 + 1.0)
+        ymin = min(min(self.speed_buf), min(self.rpm_buf))
+        ymax = max(max(self.speed_buf), max(self.rpm_buf))
+        pad = max(5.0, (ymax - ymin) * 0.1)
+        ymin, ymax = max(0.0, ymin - pad), ymax + pad
+
+        # scale data to pixels; y grows downwards on the canvas
+        x0, y0, x1, y1 = self._plot_area()
+        sx = (x1 - x0) / (t1 - t0)
+        sy = (y1 - y0) / (ymax - ymin)
+        xs = [x0 + (t - t0) * sx for t in self.t_buf]
+        if n == 1:
+            xs.append(xs[0])
+        for line, buf in ((self.speed_line, self.speed_buf), (self.rpm_line, self.rpm_buf)):
+            xy = [0.0] * (2 * len(xs))
+            xy[0::2] = xs
+            ys = [y1 - (v - ymin) * sy for v in buf]
+            xy[1::2] = ys if n > 1 else ys * 2
+            c.coords(line, xy)
+
+        self._set_plot_text(self.ymax_lbl, f"{ymax:.0f}")
+        self._set_plot_text(self.ymin_lbl, f"{ymin:.0f}")
+        self._set_plot_text(self.t0_lbl, f"{t0:.1f}")
+        self._set_plot_text(self.t1_lbl, f"{t1:.1f}")
 
     def _on_close(self) -> None:
         try:
             self.sim.stop()
         finally:
             try:
-                if self._csv_fp:
-                    self._csv_fp.close()
+                self._close_csv()
             finally:
                 self.destroy()
 
@@ -1,11 +1,26 @@
 import random
 import asyncio
+import orjson
+
+# rpm/speed stubs are served from rings filled once at import by a seeded generator
+_BUF_LEN = 4096  # power of two so the index wraps with a mask
+_rng = random.Random(0)
+_RPM_BUF = [_rng.randint(700, 7000) for _ in range(_BUF_LEN)]
+_SPEED_BUF = [round(_rng.uniform(0, 180), 2) for _ in range(_BUF_LEN)]
+_rpm_idx = 0
+_speed_idx = 0
 
 def generate_rpm():
-    return random.randint(700, 7000)
+    global _rpm_idx
+    v = _RPM_BUF[_rpm_idx & (_BUF_LEN - 1)]
+    _rpm_idx += 1
+    return v
 
 def generate_speed():
-    return round(random.uniform(0, 180), 2)
+    global _speed_idx
+    v = _SPEED_BUF[_speed_idx & (_BUF_LEN - 1)]
+    _speed_idx += 1
+    return v
 
 class VehicleSimulator:
     def __init__(self):
@@ -18,6 +33,11 @@ class VehicleSimulator:
         self.gas_pressed = False
         self.brake_pressed = False
 
+        # each tick's state, serialized once and shared by every websocket client
+        self._latest_bytes: bytes = orjson.dumps(self.get_state())
+        # created on first await so it binds to the server's loop, not whichever exists at import (Python 3.9)
+        self._new = None
+
     def press_gas(self):
         self.gas_pressed = True
         self.brake_pressed = False
@@ -47,6 +67,12 @@ class VehicleSimulator:
 
         self.voltage = 12.5 if self.rpm < 1000 else 13.8
 
+        self._latest_bytes = orjson.dumps(self.get_state())
+        if self._new is not None:
+            # set() wakes everyone already waiting; clear() re-arms for the next tick
+            self._new.set()
+            self._new.clear()
+
     def get_state(self):
         return {
             "rpm": round(self.rpm),
@@ -56,6 +82,12 @@ class VehicleSimulator:
             "battery_voltage": round(self.voltage, 2),
         }
 
+    async def next_frame(self) -> bytes:
+        if self._new is None:
+            self._new = asyncio.Event()
+        await self._new.wait()
+        return self._latest_bytes
+
     async def run(self):
         while True:
             self.update()
@@ -1,15 +1,49 @@
+import atexit
 import csv
+import time
 from datetime import datetime
 import os
 
 LOG_DIR = "logs"
 os.makedirs(LOG_DIR, exist_ok=True)
+BUFFER_BYTES = 64 * 1024
+FLUSH_INTERVAL_S = 5.0
 
-def log_data(rpm, speed, temp, fuel, voltage):
-    filename = f"{LOG_DIR}/telemetry_log.csv"
-    with open(filename, mode="a", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            rpm, speed, temp, fuel, voltage])
+_fromtimestamp = datetime.fromtimestamp
+
+# rows are collected in _pending and appended with one writerows() every FLUSH_INTERVAL_S and at exit
+_file = None
+_writer = None
+_pending = []
+_last_flush = time.monotonic()
+
+def _get_writer():
+    global _file, _writer
+    if _writer is None:
+        _file = open(f"{LOG_DIR}/telemetry_log.csv", mode="a", newline="", buffering=BUFFER_BYTES)
+        _writer = csv.writer(_file)
+    return _writer
 
+def flush():
+    global _last_flush
+    if _pending:
+        # format into new rows so _pending keeps its int timestamps if the write fails
+        rows = [[_fromtimestamp(r[0]).strftime("%Y-%m-%d %H:%M:%S"), *r[1:]] for r in _pending]
+        _get_writer().writerows(rows)
+        _pending.clear()
+    if _file is not None:
+        _file.flush()
+    _last_flush = time.monotonic()
+
+@atexit.register
+def _close():
+    flush()
+    if _file is not None:
+        _file.close()
+
+def log_data(rpm, speed, temp, fuel, voltage):
+    _pending.append([
+        int(time.time()),
+        rpm, speed, temp, fuel, voltage])
+    if time.monotonic() - _last_flush >= FLUSH_INTERVAL_S:
+        flush()